@@ -1,6 +1,9 @@
-import ipdb
+import threading
+import time
+
 import easyocr
 import cv2 as cv
+import numpy as np
 import pandas as pd
 
 
@@ -8,29 +11,104 @@ drug_file = r'C:\Users\Gaurav\PharmaSee\Images\drug list.xlsx'
 drugs_list = pd.read_excel(drug_file)
 drugs_list, drugs_type = list(drugs_list['Name']), list(drugs_list['Type'])
 
-reader = easyocr.Reader(['en'])
-tmp_img_path = r'C:\Users\Gaurav\PharmaSee\Images\img.jpg'
+reader = easyocr.Reader(['en'], cudnn_benchmark=True)
+target_fps = 30
+confidence_threshold = 0.5
 
 cap = cv.VideoCapture(0)
 if not cap.isOpened():
     print("Error. Could not open camera")
     exit()
+if not cap.set(cv.CAP_PROP_BUFFERSIZE, 1):
+    print('Failed to reduce capture buffer size. Latency will be higher!')
+cap.set(cv.CAP_PROP_FPS, target_fps)
+frame_width = int(cap.get(cv.CAP_PROP_FRAME_WIDTH))
+frame_height = int(cap.get(cv.CAP_PROP_FRAME_HEIGHT))
 
-while True:
-    ret, frame = cap.read()
-    if not ret:
-        print("Error. Could not read frame")
-        break
+# Batched detection only pays off on GPU with enough frames per batch;
+# on CPU or with small batches frames are read one at a time
+batch_size = 8
+min_batch_size = 4
+# A partial batch is read once the view stops changing or after this long
+batch_timeout = 0.5
+use_batched_ocr = reader.device != 'cpu'
+if use_batched_ocr:
+    # Warm up so cuDNN autotuning happens before the first real batch
+    reader.readtext_batched(np.zeros([batch_size, frame_height, frame_width, 3], np.uint8),
+                            n_width=frame_width, n_height=frame_height)
+
+# Capture runs on its own thread and keeps only the newest frame, so slow
+# OCR never leaves stale frames queued up in the camera driver
+latest = [None]
+lock = threading.Lock()
+stop = threading.Event()
+
+
+def capture_frames():
+    while not stop.is_set():
+        ret, f = cap.read()
+        if not ret:
+            print("Error. Could not read frame")
+            stop.set()
+            break
+        with lock:
+            latest[0] = f
+
+
+capture_thread = threading.Thread(target=capture_frames, daemon=True)
+capture_thread.start()
+
+frames = []
+batch_started = 0.0
+# Frames that barely differ from the last OCR'd one are skipped
+prev_gray_small = None
+frame_diff_threshold = 8
+
+while not stop.is_set():
+    with lock:
+        frame, latest[0] = latest[0], None
+    if frame is None:
+        time.sleep(0.01)
+        continue
     
-    cv.imwrite(tmp_img_path, frame)
+    cv.imshow('PharmaSee Demo', frame)
     key = cv.waitKey(1)
-    case
-    result = reader.readtext(tmp_img_path)
-    for (_, text, _) in result:
-        text = text.lower()
-        for i, med in enumerate(drugs_list):
-            med = med.lower()
-            if (med == text):
-                break
-    ipdb.set_trace()
-    print(f"This medicine is {med[0].upper()}{med[1:]} and it is of type {drugs_type[i]}")
\ No newline at end of file
+    if key == ord('q'):
+        stop.set()
+        break
+    small = cv.resize(cv.cvtColor(frame, cv.COLOR_BGR2GRAY), (64, 64))
+    changed = prev_gray_small is None or np.mean(cv.absdiff(small, prev_gray_small)) > frame_diff_threshold
+    if changed:
+        prev_gray_small = small
+        if not frames:
+            batch_started = time.monotonic()
+        # EasyOCR expects RGB, as it gets when loading an image file itself
+        frames.append(cv.cvtColor(frame, cv.COLOR_BGR2RGB))
+
+    if not frames:
+        continue
+    # Keep filling the batch only while the view is still changing, so a
+    # box held still is read right away instead of waiting for more frames
+    if (use_batched_ocr and changed and len(frames) < batch_size
+            and time.monotonic() - batch_started < batch_timeout):
+        continue
+    if use_batched_ocr and len(frames) >= min_batch_size:
+        results = reader.readtext_batched(frames, n_width=frame_width, n_height=frame_height)
+    else:
+        results = [reader.readtext(f) for f in frames]
+    frames = []
+
+    for result in results:
+        # Low-confidence text is dropped before it reaches the matcher
+        tokens = [t for (_, t, p) in result if p >= confidence_threshold]
+        for text in tokens:
+            text = text.lower()
+            for i, med in enumerate(drugs_list):
+                med = med.lower()
+                if (med == text):
+                    print(f"This medicine is {med[0].upper()}{med[1:]} and it is of type {drugs_type[i]}")
+                    break
+
+capture_thread.join()
+cap.release()
+cv.destroyAllWindows()
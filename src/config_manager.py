@@ -5,12 +5,14 @@ This module handles loading and accessing application configuration
 from JSON files and environment variables.
 """
 
-import json
 import logging
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,13 +40,12 @@ class ConfigManager:
     def _load_config(self) -> None:
         """Load configuration from JSON file."""
         try:
-            with open(self.config_path, 'r') as config_file:
-                self.config = json.load(config_file)
+            self.config = orjson.loads(self.config_path.read_bytes())
             logger.info(f"Configuration loaded from {self.config_path}")
         except FileNotFoundError:
             logger.error(f"Configuration file not found: {self.config_path}")
             raise
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON in configuration file: {e}")
             raise
 
@@ -79,8 +80,9 @@ class ConfigManager:
         except (KeyError, TypeError):
             return default
 
-    def get_openai_api_key(self) -> str:
-        """Get OpenAI API key from configuration."""
+    @cached_property
+    def openai_api_key(self) -> str:
+        """OpenAI API key, looked up once."""
         api_key = self.get('openai', 'api_key', default='')
         if not api_key:
             raise ValueError(
@@ -89,44 +91,186 @@ class ConfigManager:
             )
         return api_key
 
+    @cached_property
+    def openai_model(self) -> str:
+        """OpenAI model name, looked up once."""
+        return self.get('openai', 'model', default='gpt-4o-mini')
+
+    @cached_property
+    def openai_temperature(self) -> float:
+        """OpenAI temperature setting, looked up once."""
+        return self.get('openai', 'temperature', default=0.0)
+
+    @cached_property
+    def openai_max_tokens(self) -> int:
+        """OpenAI max tokens setting, looked up once."""
+        return self.get('openai', 'max_tokens', default=256)
+
+    @cached_property
+    def openai_top_p(self) -> float:
+        """OpenAI nucleus sampling setting, looked up once."""
+        return self.get('openai', 'top_p', default=1.0)
+
+    @cached_property
+    def openai_frequency_penalty(self) -> float:
+        """OpenAI frequency penalty setting, looked up once."""
+        return self.get('openai', 'frequency_penalty', default=0.0)
+
+    @cached_property
+    def openai_presence_penalty(self) -> float:
+        """OpenAI presence penalty setting, looked up once."""
+        return self.get('openai', 'presence_penalty', default=0.0)
+
+    @cached_property
+    def openai_max_retries(self) -> int:
+        """OpenAI API retry count, looked up once."""
+        return self.get('openai', 'max_retries', default=3)
+
+    @cached_property
+    def camera_index(self) -> int:
+        """Camera device index, looked up once."""
+        return self.get('camera', 'device_index', default=0)
+
+    @cached_property
+    def camera_resolution(self) -> tuple:
+        """Camera resolution as (width, height), looked up once."""
+        width = self.get('camera', 'frame_width', default=1280)
+        height = self.get('camera', 'frame_height', default=720)
+        return (width, height)
+
+    @cached_property
+    def camera_buffer_size(self) -> int:
+        """Camera driver frame buffer size, looked up once."""
+        return self.get('camera', 'buffer_size', default=1)
+
+    @cached_property
+    def ocr_languages(self) -> list:
+        """OCR languages, looked up once."""
+        return self.get('ocr', 'languages', default=['en'])
+
+    @cached_property
+    def ocr_confidence_threshold(self) -> float:
+        """OCR confidence threshold, looked up once."""
+        return self.get('ocr', 'confidence_threshold', default=0.5)
+
+    @cached_property
+    def ocr_roi(self) -> tuple:
+        """OCR region of interest as (width, height) fractions of the frame, looked up once."""
+        width = self.get('ocr', 'roi_width', default=0.6)
+        height = self.get('ocr', 'roi_height', default=0.4)
+        return (width, height)
+
+    @cached_property
+    def ocr_max_image_side(self) -> int:
+        """Longest side in pixels of images passed to OCR, looked up once."""
+        return self.get('ocr', 'max_image_side', default=800)
+
+    @cached_property
+    def ocr_text_gate(self) -> tuple:
+        """Minimum (edge pixels, sharpness) of the OCR region, looked up once."""
+        min_edge_pixels = self.get('ocr', 'min_edge_pixels', default=200)
+        min_sharpness = self.get('ocr', 'min_sharpness', default=30.0)
+        return (min_edge_pixels, min_sharpness)
+
+    @cached_property
+    def ocr_jit(self) -> bool:
+        """Whether OCR models run as TorchScript traces, looked up once."""
+        return bool(self.get('ocr', 'jit', default=False))
+
+    @cached_property
+    def ocr_use_gpu(self) -> Optional[bool]:
+        """
+        Whether OCR runs on the GPU, looked up once.
+
+        Accepts "auto", "true" or "false" (or a JSON boolean). None means
+        use the GPU if CUDA is available.
+        """
+        value = self.get('ocr', 'use_gpu', default='auto')
+        if isinstance(value, str):
+            value = value.strip().lower()
+            if value == 'auto':
+                return None
+            return value == 'true'
+        return bool(value)
+
+    @cached_property
+    def medicine_database_path(self) -> Path:
+        """Path to the medicine database CSV file, resolved once."""
+        project_root = Path(__file__).parent.parent
+        relative_path = self.get('paths', 'medicine_database', default='data/medicines.csv')
+        return project_root / relative_path
+
+    @cached_property
+    def analysis_cache_path(self) -> Path:
+        """Path to the saved LLM analysis cache, resolved once."""
+        project_root = Path(__file__).parent.parent
+        relative_path = self.get('paths', 'analysis_cache', default='config/analysis_cache.json')
+        return project_root / relative_path
+
+    @cached_property
+    def jit_cache_path(self) -> Path:
+        """Directory for traced OCR models, resolved once."""
+        project_root = Path(__file__).parent.parent
+        relative_path = self.get('paths', 'jit_cache', default='config/jit_cache')
+        return project_root / relative_path
+
+    @cached_property
+    def analysis_cache_size(self) -> int:
+        """Maximum number of cached LLM analyses, looked up once."""
+        return self.get('openai', 'cache_size', default=256)
+
+    @cached_property
+    def scan_interval(self) -> float:
+        """Scan interval in seconds, looked up once."""
+        return self.get('scanner', 'scan_interval_seconds', default=2.0)
+
+    @cached_property
+    def scanner_workers(self) -> int:
+        """Number of OCR worker processes for batch scanning, looked up once."""
+        return self.get('scanner', 'workers', default=2)
+
+    @cached_property
+    def scanner_target_fps(self) -> float:
+        """Preview refresh rate in frames per second, looked up once."""
+        return self.get('scanner', 'target_fps', default=30)
+
+    # Aliases kept for callers of the original getter methods
+    def get_openai_api_key(self) -> str:
+        """Get OpenAI API key from configuration."""
+        return self.openai_api_key
+
     def get_openai_model(self) -> str:
         """Get OpenAI model name from configuration."""
-        return self.get('openai', 'model', default='gpt-3.5-turbo')
+        return self.openai_model
 
     def get_openai_temperature(self) -> float:
         """Get OpenAI temperature setting from configuration."""
-        return self.get('openai', 'temperature', default=0.3)
+        return self.openai_temperature
 
     def get_openai_max_tokens(self) -> int:
         """Get OpenAI max tokens setting from configuration."""
-        return self.get('openai', 'max_tokens', default=200)
+        return self.openai_max_tokens
 
     def get_camera_index(self) -> int:
         """Get camera device index from configuration."""
-        return self.get('camera', 'device_index', default=0)
+        return self.camera_index
 
     def get_camera_resolution(self) -> tuple:
         """Get camera resolution from configuration."""
-        width = self.get('camera', 'frame_width', default=1280)
-        height = self.get('camera', 'frame_height', default=720)
-        return (width, height)
+        return self.camera_resolution
 
     def get_ocr_languages(self) -> list:
         """Get OCR languages from configuration."""
-        return self.get('ocr', 'languages', default=['en'])
+        return self.ocr_languages
 
     def get_ocr_confidence_threshold(self) -> float:
         """Get OCR confidence threshold from configuration."""
-        return self.get('ocr', 'confidence_threshold', default=0.5)
+        return self.ocr_confidence_threshold
 
     def get_medicine_database_path(self) -> Path:
         """Get path to medicine database CSV file."""
-        project_root = Path(__file__).parent.parent
-        relative_path = self.get('paths', 'medicine_database', default='data/medicines.csv')
-        return project_root / relative_path
+        return self.medicine_database_path
 
     def get_scan_interval(self) -> float:
         """Get scan interval in seconds from configuration."""
-        return self.get('scanner', 'scan_interval_seconds', default=2.0)
-
-
+        return self.scan_interval
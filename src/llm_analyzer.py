@@ -1,36 +1,108 @@
 """
 LLM Analyzer Module
 
-This module uses OpenAI's GPT-3.5 to analyze medicine names and determine
+This module uses OpenAI chat models to analyze medicine names and determine
 their type, usage, and other relevant information.
 """
 
+import asyncio
+import json
 import logging
-from typing import Dict, Optional
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 logger = logging.getLogger(__name__)
 
+# Matches "Key: value" lines from models that ignore the JSON response format
+_RESPONSE_FIELD_PATTERN = re.compile(
+    r'^[^\S\n]*(Type|Use|Class|Form)[^\S\n]*:[^\S\n]*(\S.*?)[^\S\n]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+_RESPONSE_FIELD_KEYS = {
+    'type': 'type',
+    'use': 'use',
+    'class': 'drug_class',
+    'form': 'form'
+}
+
+_UNKNOWN_ANALYSIS = {
+    'type': 'Unknown',
+    'use': 'Unknown',
+    'drug_class': 'Unknown',
+    'form': 'Unknown'
+}
+
 
 class MedicineLLMAnalyzer:
     """Uses Large Language Models to analyze and classify medicines."""
 
-    def __init__(self, api_key: str, model: str = "gpt-3.5-turbo", 
-                 temperature: float = 0.3, max_tokens: int = 200):
+    # Literal braces are doubled for str.format
+    _PROMPT_TEMPLATE = """You are a pharmaceutical expert assistant. Analyze the following medicine name.
+
+Medicine Name: {medicine_name}
+
+Reply with only a JSON object with these keys:
+"type": medicine type (e.g., Antibiotic, Analgesic, Antacid, Antihistamine)
+"use": brief primary use
+"drug_class": pharmacological classification
+"form": common form (Tablet, Capsule, Cream, Syrup, etc.)
+
+If you don't recognize the medicine name or it doesn't appear to be a valid medicine, reply with:
+{{"type": "Unknown", "use": "Unable to determine - please verify medicine name", "drug_class": "Unknown", "form": "Unknown"}}"""
+
+    _SYSTEM_MESSAGE = {
+        "role": "system",
+        "content": "You are a pharmaceutical expert providing accurate medicine information."
+    }
+
+    def __init__(self, api_key: str, model: str = "gpt-4o-mini", 
+                 temperature: float = 0.0, max_tokens: int = 256,
+                 top_p: float = 1.0, frequency_penalty: float = 0.0,
+                 presence_penalty: float = 0.0,
+                 cache_size: int = 256, max_retries: int = 3,
+                 max_concurrent_requests: int = 10):
         """
         Initialize the LLM analyzer.
 
         Args:
             api_key: OpenAI API key.
-            model: Model name to use (default: gpt-3.5-turbo).
+            model: Model name to use (default: gpt-4o-mini).
             temperature: Model temperature for response variability.
             max_tokens: Maximum tokens in response.
+            top_p: Nucleus sampling probability mass.
+            frequency_penalty: Penalty for repeating frequent tokens.
+            presence_penalty: Penalty for repeating any seen token.
+            cache_size: Maximum number of analyses kept in the cache.
+            max_retries: Retries with exponential backoff on rate limits,
+                         server errors and connection failures.
+            max_concurrent_requests: Maximum API calls in flight at once
+                                     from analyze_many.
         """
-        self.client = OpenAI(api_key=api_key)
+        # The OpenAI clients back off exponentially between retries
+        self.client = OpenAI(api_key=api_key, max_retries=max_retries)
+        self.async_client = AsyncOpenAI(api_key=api_key, max_retries=max_retries)
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.top_p = top_p
+        self.frequency_penalty = frequency_penalty
+        self.presence_penalty = presence_penalty
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._max_concurrent_requests = max_concurrent_requests
+        # Created together with the event loop it is used on
+        self._request_semaphore: Optional[asyncio.Semaphore] = None
+        # Requests in flight by normalized name, only touched on the loop
+        self._pending_analyses: Dict[str, asyncio.Future] = {}
         logger.info(f"Initialized LLM Analyzer with model: {model}")
 
     def _create_medicine_analysis_prompt(self, medicine_name: str) -> str:
@@ -43,29 +115,155 @@ class MedicineLLMAnalyzer:
         Returns:
             Formatted prompt string.
         """
-        prompt = f"""You are a pharmaceutical expert assistant. Analyze the following medicine name and provide structured information.
+        return self._PROMPT_TEMPLATE.format(medicine_name=medicine_name)
 
-Medicine Name: {medicine_name}
+    def _create_completion_request(self, medicine_name: str) -> Dict[str, Any]:
+        """
+        Build the chat completion arguments for a medicine analysis.
+
+        Args:
+            medicine_name: Name of the medicine to analyze.
+
+        Returns:
+            Keyword arguments for chat.completions.create.
+        """
+        prompt = self._create_medicine_analysis_prompt(medicine_name)
+        return {
+            'model': self.model,
+            'messages': [
+                self._SYSTEM_MESSAGE,
+                {"role": "user", "content": prompt}
+            ],
+            'temperature': self.temperature,
+            'max_tokens': self.max_tokens,
+            'top_p': self.top_p,
+            'frequency_penalty': self.frequency_penalty,
+            'presence_penalty': self.presence_penalty,
+            'response_format': {"type": "json_object"}
+        }
+
+    def _get_cached_analysis(self, medicine_name: str) -> Optional[Dict[str, str]]:
+        """
+        Look up a previous analysis of a medicine.
+
+        Args:
+            medicine_name: Name of the medicine.
+
+        Returns:
+            Copy of the cached analysis, or None if not analyzed yet.
+        """
+        cache_key = medicine_name.strip().lower()
+        with self._cache_lock:
+            cached_info = self._cache.get(cache_key)
+            if cached_info is None:
+                return None
+            self._cache.move_to_end(cache_key)
+        logger.debug(f"Using cached analysis for: {medicine_name}")
+        return cached_info.copy()
+
+    def _handle_response(self, medicine_name: str, response: Any) -> Dict[str, str]:
+        """
+        Parse a chat completion response and cache the result.
+
+        Args:
+            medicine_name: Name of the analyzed medicine.
+            response: Chat completion returned by the OpenAI client.
+
+        Returns:
+            Dictionary with parsed medicine information.
+        """
+        # Extract the response text
+        choice = response.choices[0]
+        response_text = (choice.message.content or '').strip()
+        logger.debug(f"LLM Response: {response_text}")
+
+        # Parse the structured response
+        fields = self._parse_response_fields(response_text)
+        medicine_info = dict(_UNKNOWN_ANALYSIS, **fields)
 
-Please provide the following information in a structured format:
-1. Medicine Type: (e.g., Antibiotic, Analgesic, Antacid, Antihistamine, etc.)
-2. Primary Use: (Brief description of what it's used for)
-3. Drug Class: (Pharmacological classification)
-4. Common Form: (Tablet, Capsule, Cream, Syrup, etc.)
+        # Only complete, parseable analyses are cached so failures get retried
+        if not fields or choice.finish_reason == 'length':
+            logger.warning(f"Unusable LLM response for {medicine_name}: {response_text!r}")
+            return medicine_info
+
+        logger.info(f"Successfully analyzed medicine: {medicine_name} - Type: {medicine_info['type']}")
+        self._store_analysis(medicine_name.strip().lower(), medicine_info)
+        return medicine_info.copy()
+
+    def _store_analysis(self, cache_key: str, medicine_info: Dict[str, str]) -> None:
+        """
+        Add an analysis to the cache, evicting the least recently used.
+
+        Args:
+            cache_key: Normalized medicine name.
+            medicine_info: Parsed medicine information.
+        """
+        with self._cache_lock:
+            self._cache[cache_key] = medicine_info
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def load_cache(self, cache_path: Path) -> None:
+        """
+        Load analyses saved by a previous session.
+
+        Args:
+            cache_path: Path to the JSON cache file. A missing file is ignored.
+        """
+        cache_path = Path(cache_path)
+        if not cache_path.exists():
+            return
+
+        try:
+            entries = json.loads(cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load analysis cache: {e}")
+            return
+
+        if not isinstance(entries, dict):
+            logger.warning(f"Ignoring malformed analysis cache: {cache_path}")
+            return
+
+        for cache_key, medicine_info in entries.items():
+            if isinstance(medicine_info, dict):
+                self._store_analysis(cache_key, medicine_info)
+        logger.info(f"Loaded {len(self._cache)} cached analyses from {cache_path}")
 
-Format your response as follows:
-Type: [medicine type]
-Use: [primary use]
-Class: [drug class]
-Form: [common form]
+    def save_cache(self, cache_path: Path) -> None:
+        """
+        Save cached analyses so later sessions can reuse them.
+
+        Args:
+            cache_path: Path to the JSON cache file.
+        """
+        with self._cache_lock:
+            entries = dict(self._cache)
+
+        try:
+            Path(cache_path).write_text(json.dumps(entries, indent=2), encoding='utf-8')
+            logger.info(f"Saved {len(entries)} cached analyses to {cache_path}")
+        except OSError as e:
+            logger.warning(f"Could not save analysis cache: {e}")
+
+    @staticmethod
+    def _error_info(error: Exception) -> Dict[str, str]:
+        """
+        Build the analysis returned when the LLM call fails.
 
-If you don't recognize the medicine name or it doesn't appear to be a valid medicine, respond with:
-Type: Unknown
-Use: Unable to determine - please verify medicine name
-Class: Unknown
-Form: Unknown"""
+        Args:
+            error: Exception raised by the API call.
 
-        return prompt
+        Returns:
+            Dictionary describing the failure.
+        """
+        logger.error(f"Error analyzing medicine with LLM: {error}")
+        return {
+            'type': 'Error',
+            'use': f'Failed to analyze: {str(error)}',
+            'drug_class': 'Unknown',
+            'form': 'Unknown'
+        }
 
     def analyze_medicine(self, medicine_name: str) -> Dict[str, str]:
         """
@@ -81,43 +279,192 @@ Form: Unknown"""
             - drug_class: Pharmacological class
             - form: Physical form (tablet, cream, etc.)
 
+            Results are cached per medicine name, so repeated calls for the
+            same medicine do not hit the API again.
+
         Raises:
             Exception: If LLM API call fails.
         """
+        cached_info = self._get_cached_analysis(medicine_name)
+        if cached_info is not None:
+            return cached_info
+
         logger.info(f"Analyzing medicine: {medicine_name}")
 
         try:
-            prompt = self._create_medicine_analysis_prompt(medicine_name)
-            
             response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a pharmaceutical expert providing accurate medicine information."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens
+                **self._create_completion_request(medicine_name)
             )
+            return self._handle_response(medicine_name, response)
 
-            # Extract the response text
-            response_text = response.choices[0].message.content.strip()
-            logger.debug(f"LLM Response: {response_text}")
+        except Exception as e:
+            return self._error_info(e)
 
-            # Parse the structured response
-            medicine_info = self._parse_llm_response(response_text)
-            
-            logger.info(f"Successfully analyzed medicine: {medicine_name} - Type: {medicine_info.get('type', 'Unknown')}")
-            return medicine_info
+    async def _analyze_medicine_async(self, medicine_name: str) -> Dict[str, str]:
+        """
+        Analyze a medicine using the async OpenAI client.
+
+        Must run on the analyzer's own event loop (see _get_event_loop),
+        which the async client's connection pool and the request semaphore
+        are bound to.
+
+        Args:
+            medicine_name: Name of the medicine to analyze.
+
+        Returns:
+            Dictionary containing medicine information, as analyze_medicine.
+        """
+        cached_info = self._get_cached_analysis(medicine_name)
+        if cached_info is not None:
+            return cached_info
+
+        # Callers asking for a medicine already being analyzed share its request
+        cache_key = medicine_name.strip().lower()
+        pending = self._pending_analyses.get(cache_key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._request_analysis(medicine_name))
+            self._pending_analyses[cache_key] = pending
+            pending.add_done_callback(
+                lambda _: self._pending_analyses.pop(cache_key, None)
+            )
+
+        medicine_info = await asyncio.shield(pending)
+        return medicine_info.copy()
+
+    async def _request_analysis(self, medicine_name: str) -> Dict[str, str]:
+        """
+        Send one analysis request with the async OpenAI client.
+
+        Args:
+            medicine_name: Name of the medicine to analyze.
+
+        Returns:
+            Dictionary containing medicine information, as analyze_medicine.
+        """
+        logger.info(f"Analyzing medicine: {medicine_name}")
+
+        try:
+            async with self._request_semaphore:
+                response = await self.async_client.chat.completions.create(
+                    **self._create_completion_request(medicine_name)
+                )
+            return self._handle_response(medicine_name, response)
 
         except Exception as e:
-            logger.error(f"Error analyzing medicine with LLM: {e}")
+            return self._error_info(e)
+
+    def analyze_many(self, medicine_names: List[str]) -> List[Dict[str, str]]:
+        """
+        Analyze several medicines with concurrent API calls.
+
+        Args:
+            medicine_names: Names of the medicines to analyze.
+
+        Returns:
+            List of analysis dictionaries in the same order as the names.
+        """
+        if not medicine_names:
+            return []
+
+        # Names differing only in case or spacing share one API call
+        unique_names: Dict[str, str] = {}
+        for name in medicine_names:
+            unique_names.setdefault(name.strip().lower(), name)
+
+        async def gather_analyses() -> List[Dict[str, str]]:
+            return await asyncio.gather(
+                *[self._analyze_medicine_async(name) for name in unique_names.values()]
+            )
+
+        future = asyncio.run_coroutine_threadsafe(gather_analyses(), self._get_event_loop())
+        analyses = dict(zip(unique_names, future.result()))
+        return [analyses[name.strip().lower()].copy() for name in medicine_names]
+
+    def prefetch(self, medicine_names: List[str]) -> None:
+        """
+        Start analyses in the background without waiting for them.
+
+        Results land in the analysis cache, so a later analyze_medicine or
+        analyze_many call for the same medicine returns immediately, and
+        analyze_many waits on a request still in flight instead of sending
+        another.
+
+        Args:
+            medicine_names: Names of the medicines to analyze.
+        """
+        unique_names: Dict[str, str] = {}
+        for name in medicine_names:
+            unique_names.setdefault(name.strip().lower(), name)
+
+        loop = None
+        for cache_key, name in unique_names.items():
+            if cache_key in self._pending_analyses:
+                continue
+            if self._get_cached_analysis(name) is not None:
+                continue
+            if loop is None:
+                loop = self._get_event_loop()
+            asyncio.run_coroutine_threadsafe(self._analyze_medicine_async(name), loop)
+
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the background event loop used for async API calls.
+
+        A single long-lived loop is kept so the async client's connection
+        pool is reused across calls instead of being tied to a closed loop.
+
+        Returns:
+            Running event loop on a daemon thread.
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="llm-analyzer-loop",
+                    daemon=True
+                ).start()
+
+                # Created on the loop itself, since before Python 3.10
+                # semaphores bind to the loop current at creation
+                async def create_semaphore() -> asyncio.Semaphore:
+                    return asyncio.Semaphore(self._max_concurrent_requests)
+
+                self._request_semaphore = asyncio.run_coroutine_threadsafe(
+                    create_semaphore(), loop
+                ).result()
+                self._loop = loop
+            return self._loop
+
+    def _parse_response_fields(self, response_text: str) -> Dict[str, str]:
+        """
+        Extract the analysis fields present in an LLM response.
+
+        The model is asked for a JSON object; "Key: value" lines are
+        accepted as a fallback for models that ignore the JSON format.
+
+        Args:
+            response_text: Raw response text from LLM.
+
+        Returns:
+            Dictionary with only the fields found, empty if none were.
+        """
+        try:
+            parsed = json.loads(response_text)
+        except json.JSONDecodeError:
+            parsed = None
+
+        if isinstance(parsed, dict):
             return {
-                'type': 'Error',
-                'use': f'Failed to analyze: {str(e)}',
-                'drug_class': 'Unknown',
-                'form': 'Unknown'
+                key: str(parsed[key]).strip()
+                for key in _UNKNOWN_ANALYSIS if parsed.get(key)
             }
 
+        return {
+            _RESPONSE_FIELD_KEYS[key.lower()]: value
+            for key, value in _RESPONSE_FIELD_PATTERN.findall(response_text)
+        }
+
     def _parse_llm_response(self, response_text: str) -> Dict[str, str]:
         """
         Parse the structured response from the LLM.
@@ -126,34 +473,10 @@ Form: Unknown"""
             response_text: Raw response text from LLM.
 
         Returns:
-            Dictionary with parsed medicine information.
+            Dictionary with parsed medicine information, with "Unknown"
+            for any field missing from the response.
         """
-        info = {
-            'type': 'Unknown',
-            'use': 'Unknown',
-            'drug_class': 'Unknown',
-            'form': 'Unknown'
-        }
-
-        # Parse the structured response
-        lines = response_text.strip().split('\n')
-        for line in lines:
-            line = line.strip()
-            if ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip().lower()
-                value = value.strip()
-
-                if key == 'type':
-                    info['type'] = value
-                elif key == 'use':
-                    info['use'] = value
-                elif key == 'class':
-                    info['drug_class'] = value
-                elif key == 'form':
-                    info['form'] = value
-
-        return info
+        return dict(_UNKNOWN_ANALYSIS, **self._parse_response_fields(response_text))
 
     def get_medicine_type(self, medicine_name: str) -> str:
         """
@@ -6,27 +6,40 @@ from CSV files with fuzzy matching capabilities.
 """
 
 import logging
+import math
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process
 
 logger = logging.getLogger(__name__)
 
+# Optional CSV columns describing a medicine, named like the LLM analysis keys
+RECORD_COLUMNS = ('type', 'use', 'drug_class', 'form')
+
 
 class MedicineDatabase:
     """Manages the medicine database with search capabilities."""
 
-    def __init__(self, database_path: str):
+    def __init__(self, database_path: str, search_cache_size: int = 4096):
         """
         Initialize the medicine database.
 
         Args:
             database_path: Path to the CSV file containing medicine data.
+            search_cache_size: Maximum number of search results to memoize.
         """
         self.database_path = Path(database_path)
         self.medicines: List[str] = []
+        self._records: Dict[str, Dict[str, str]] = {}
+        self._medicines_lower: List[str] = []
+        self._exact_index: Dict[str, str] = {}
+        self._by_length: Dict[int, List[int]] = {}
+        self._search_cache_size = search_cache_size
+        self._search_cache: OrderedDict = OrderedDict()
         self._load_database()
 
     def _load_database(self) -> None:
@@ -36,21 +49,164 @@ class MedicineDatabase:
                 logger.warning(f"Database file not found: {self.database_path}")
                 logger.info("Creating empty medicine database")
                 self.medicines = []
+                self._records = {}
+                self._build_indexes()
                 return
 
-            df = pd.read_csv(self.database_path)
+            # Read just the header first to validate the schema
+            columns = pd.read_csv(self.database_path, nrows=0).columns
             
             # Expecting at least a 'name' column
-            if 'name' not in df.columns:
+            if 'name' not in columns:
                 logger.error("CSV must contain a 'name' column")
                 raise ValueError("Invalid CSV format: missing 'name' column")
             
-            self.medicines = df['name'].dropna().str.strip().tolist()
+            # Only materialize the columns that are actually used
+            record_columns = [column for column in RECORD_COLUMNS if column in columns]
+            df = pd.read_csv(
+                self.database_path,
+                usecols=['name', *record_columns],
+                dtype='string'
+            )
+            df = df.dropna(subset=['name'])
+            
+            names = df['name'].str.strip()
+            self.medicines = names.tolist()
+            self._records = self._build_records(df, record_columns)
+            # Lowercase the whole column in one vectorized pass
+            self._build_indexes(names.str.lower().tolist())
             logger.info(f"Loaded {len(self.medicines)} medicines from database")
 
         except Exception as e:
             logger.error(f"Error loading medicine database: {e}")
             self.medicines = []
+            self._records = {}
+            self._build_indexes()
+
+    def _build_records(self, df: pd.DataFrame, record_columns: List[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Collect the optional metadata columns for each medicine.
+
+        Args:
+            df: Loaded database rows, aligned with self.medicines.
+            record_columns: Metadata columns present in the CSV.
+
+        Returns:
+            Mapping of medicine name to its non-empty metadata fields.
+        """
+        records: Dict[str, Dict[str, str]] = {}
+        if not record_columns:
+            return records
+
+        for medicine, values in zip(self.medicines, df[record_columns].itertuples(index=False)):
+            record = {
+                column: value.strip()
+                for column, value in zip(record_columns, values)
+                if not pd.isna(value) and value.strip()
+            }
+            if record:
+                # Keep the first occurrence, matching the exact-match index
+                records.setdefault(medicine, record)
+        return records
+
+    def _build_indexes(self, medicines_lower: Optional[List[str]] = None) -> None:
+        """
+        Rebuild the search indexes from the current medicine list.
+
+        Args:
+            medicines_lower: Lowercased names parallel to self.medicines,
+                            if already computed.
+        """
+        if medicines_lower is None:
+            medicines_lower = [medicine.lower() for medicine in self.medicines]
+
+        self._medicines_lower = []
+        self._exact_index = {}
+        self._by_length = {}
+        for medicine, medicine_lower in zip(self.medicines, medicines_lower):
+            self._index_medicine(medicine, medicine_lower)
+
+    def _index_medicine(self, medicine: str, medicine_lower: Optional[str] = None) -> None:
+        """
+        Add a single medicine to the search indexes.
+
+        Args:
+            medicine: Canonical medicine name, already appended to self.medicines.
+            medicine_lower: Lowercased name, if already computed.
+        """
+        # Lowercased once here so searches don't re-lowercase per query
+        if medicine_lower is None:
+            medicine_lower = medicine.lower()
+        index = len(self._medicines_lower)
+        self._medicines_lower.append(medicine_lower)
+        # Keep the first occurrence, matching the original scan order
+        self._exact_index.setdefault(medicine_lower, medicine)
+        self._by_length.setdefault(len(medicine_lower), []).append(index)
+
+    @staticmethod
+    def _length_bounds(query_length: int, threshold: int) -> Optional[Tuple[int, int]]:
+        """
+        Get the range of medicine name lengths that can reach the threshold.
+
+        fuzz.ratio is bounded by 200 * min(a, b) / (a + b) for strings of
+        lengths a and b, so entries far shorter or longer than the query
+        can never score high enough and need not be compared.
+
+        Args:
+            query_length: Length of the normalized query.
+            threshold: Minimum similarity score (0-100).
+
+        Returns:
+            Tuple of (min_length, max_length), or None if every entry has
+            to be considered.
+        """
+        if threshold <= 0 or query_length == 0:
+            return None
+
+        # Small epsilon guards against float rounding excluding a boundary length
+        min_length = math.ceil(query_length * threshold / (200 - threshold) - 1e-9)
+        max_length = math.floor(query_length * (200 - threshold) / threshold + 1e-9)
+        return (min_length, max_length)
+
+    def _length_candidates(self, min_length: int, max_length: int) -> List[int]:
+        """
+        Get indices of medicines with a name length in the given range.
+
+        Args:
+            min_length: Shortest name length to include.
+            max_length: Longest name length to include.
+
+        Returns:
+            Candidate indices into self.medicines, in database order.
+        """
+        candidates = []
+        for length in range(min_length, max_length + 1):
+            candidates.extend(self._by_length.get(length, ()))
+        # Database order keeps ties resolving to the first entry, as in a full scan
+        candidates.sort()
+        return candidates
+
+    def might_contain(self, text: str, threshold: int = 80) -> bool:
+        """
+        Cheaply check whether text can reach the threshold against any medicine.
+
+        Uses the same length bound as search_medicine, so text rejected here
+        (e.g. a long line of label text) is never one search_medicine would
+        match. Text that passes may still match nothing.
+
+        Args:
+            text: Text to check, e.g. an OCR result.
+            threshold: Minimum similarity score (0-100) used for the search.
+
+        Returns:
+            False if no medicine name has a length that can reach the
+            threshold, True otherwise.
+        """
+        bounds = self._length_bounds(len(text.lower().strip()), threshold)
+        if bounds is None:
+            return True
+        min_length, max_length = bounds
+        return any(min_length <= length <= max_length for length in self._by_length)
 
     def search_medicine(self, query: str, threshold: int = 80) -> Optional[str]:
         """
@@ -68,30 +224,150 @@ class MedicineDatabase:
             return None
 
         query_lower = query.lower().strip()
-        
+        cache_key = (query_lower, threshold)
+
+        # OCR tends to produce the same tokens frame after frame
+        if cache_key in self._search_cache:
+            self._search_cache.move_to_end(cache_key)
+            return self._search_cache[cache_key]
+
+        result = self._match_medicine(query_lower, threshold)
+        self._cache_result(cache_key, result)
+        return result
+
+    def _cache_result(self, cache_key: Tuple[str, int], result: Optional[str]) -> None:
+        """
+        Store a search result, evicting the least recently used one if full.
+
+        Args:
+            cache_key: Tuple of (normalized query, threshold).
+            result: Matched medicine name or None.
+        """
+        self._search_cache[cache_key] = result
+        if len(self._search_cache) > self._search_cache_size:
+            self._search_cache.popitem(last=False)
+
+    def _match_medicine(self, query_lower: str, threshold: int) -> Optional[str]:
+        """
+        Match a normalized query against the database without caching.
+
+        Args:
+            query_lower: Lowercased, stripped medicine name.
+            threshold: Minimum similarity score (0-100) to consider a match.
+
+        Returns:
+            Matched medicine name or None if no match found.
+        """
         # First, try exact match
-        for medicine in self.medicines:
-            if medicine.lower() == query_lower:
-                logger.info(f"Exact match found: {medicine}")
-                return medicine
-
-        # If no exact match, try fuzzy matching
-        best_match = None
-        best_score = 0
-
-        for medicine in self.medicines:
-            score = fuzz.ratio(query_lower, medicine.lower())
-            if score > best_score:
-                best_score = score
-                best_match = medicine
-
-        if best_score >= threshold:
-            logger.info(f"Fuzzy match found: {best_match} (score: {best_score})")
+        exact_match = self._exact_index.get(query_lower)
+        if exact_match is not None:
+            logger.info(f"Exact match found: {exact_match}")
+            return exact_match
+
+        # If no exact match, try fuzzy matching against plausible lengths only
+        bounds = self._length_bounds(len(query_lower), threshold)
+        if bounds is None:
+            candidates = range(len(self._medicines_lower))
+        else:
+            candidates = self._length_candidates(*bounds)
+
+        if not candidates:
+            logger.debug(f"No match found for: {query_lower}")
+            return None
+
+        match = process.extractOne(
+            query_lower,
+            [self._medicines_lower[i] for i in candidates],
+            scorer=fuzz.ratio,
+            score_cutoff=threshold
+        )
+
+        if match is not None:
+            _, score, position = match
+            best_match = self.medicines[candidates[position]]
+            logger.info(f"Fuzzy match found: {best_match} (score: {score:.0f})")
             return best_match
         
-        logger.debug(f"No match found for: {query} (best score: {best_score})")
+        logger.debug(f"No match found for: {query_lower}")
         return None
 
+    def search_batch(self, queries: List[str], threshold: int = 80) -> List[Optional[str]]:
+        """
+        Search for several medicines at once using fuzzy matching.
+
+        Results are shared with search_medicine through the search cache.
+        The remaining queries that are not exact matches are scored in a
+        single call, against entries whose length allows a match for at
+        least one of them. Results are the same as calling search_medicine
+        for each query.
+
+        Args:
+            queries: Medicine names to search for.
+            threshold: Minimum similarity score (0-100) to consider a match.
+
+        Returns:
+            List with the matched medicine name (or None) for each query.
+        """
+        if not self.medicines:
+            logger.warning("Medicine database is empty")
+            return [None] * len(queries)
+
+        results: List[Optional[str]] = [None] * len(queries)
+        # Positions of each distinct query that still needs fuzzy matching
+        pending: Dict[str, List[int]] = {}
+
+        for i, query in enumerate(queries):
+            query_lower = query.lower().strip()
+            cache_key = (query_lower, threshold)
+
+            if cache_key in self._search_cache:
+                self._search_cache.move_to_end(cache_key)
+                results[i] = self._search_cache[cache_key]
+            elif query_lower in pending:
+                pending[query_lower].append(i)
+            elif query_lower in self._exact_index:
+                results[i] = self._exact_index[query_lower]
+                self._cache_result(cache_key, results[i])
+            else:
+                pending[query_lower] = [i]
+
+        if not pending:
+            return results
+
+        pending_queries = list(pending)
+        bounds = [self._length_bounds(len(query_lower), threshold)
+                  for query_lower in pending_queries]
+        if any(bound is None for bound in bounds):
+            candidates = list(range(len(self._medicines_lower)))
+        else:
+            candidates = self._length_candidates(
+                min(bound[0] for bound in bounds),
+                max(bound[1] for bound in bounds)
+            )
+
+        if candidates:
+            scores = process.cdist(
+                pending_queries,
+                [self._medicines_lower[i] for i in candidates],
+                scorer=fuzz.ratio,
+                score_cutoff=threshold
+            )
+            # argmax returns the first best entry, in database order
+            best_positions = np.argmax(scores, axis=1)
+
+        for row, query_lower in enumerate(pending_queries):
+            result = None
+            if candidates:
+                best_position = best_positions[row]
+                if scores[row, best_position] >= threshold:
+                    result = self.medicines[candidates[best_position]]
+
+            self._cache_result((query_lower, threshold), result)
+            for i in pending[query_lower]:
+                results[i] = result
+
+        return results
+
     def get_best_matches(self, query: str, top_n: int = 5) -> List[Tuple[str, int]]:
         """
         Get the top N best matching medicines with their scores.
@@ -108,15 +384,29 @@ class MedicineDatabase:
 
         query_lower = query.lower().strip()
         
-        matches = [
-            (medicine, fuzz.ratio(query_lower, medicine.lower()))
-            for medicine in self.medicines
-        ]
-        
-        # Sort by score descending
-        matches.sort(key=lambda x: x[1], reverse=True)
+        # Results come back sorted by score descending
+        results = process.extract(
+            query_lower,
+            self._medicines_lower,
+            scorer=fuzz.ratio,
+            limit=top_n
+        )
         
-        return matches[:top_n]
+        return [(self.medicines[index], round(score)) for _, score, index in results]
+
+    def get_record(self, medicine_name: str) -> Optional[Dict[str, str]]:
+        """
+        Get the metadata stored in the database for a medicine.
+
+        Args:
+            medicine_name: Canonical medicine name, as returned by search_medicine.
+
+        Returns:
+            Dictionary with any of the keys type, use, drug_class and form
+            found in the CSV, or None if the medicine has no metadata.
+        """
+        record = self._records.get(medicine_name)
+        return record.copy() if record is not None else None
 
     def is_valid_medicine(self, medicine_name: str, threshold: int = 80) -> bool:
         """
@@ -143,6 +433,9 @@ class MedicineDatabase:
         medicine_name = medicine_name.strip()
         if medicine_name and medicine_name not in self.medicines:
             self.medicines.append(medicine_name)
+            self._index_medicine(medicine_name)
+            # Cached misses may now match the new entry
+            self._search_cache.clear()
             logger.info(f"Added medicine to database: {medicine_name}")
 
     def get_all_medicines(self) -> List[str]:
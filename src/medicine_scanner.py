@@ -5,16 +5,18 @@ Main application for real-time medicine identification using OCR and LLM analysi
 """
 
 import logging
+import queue
+import threading
 import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import cv2 as cv
 import numpy as np
 
 from config_manager import ConfigManager
 from llm_analyzer import MedicineLLMAnalyzer
-from medicine_database import MedicineDatabase
+from medicine_database import RECORD_COLUMNS, MedicineDatabase
 from ocr_reader import OCRReader
 
 # Configure logging
@@ -24,10 +26,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Key polling timeout once the camera has shown nothing text-like for a while
+IDLE_WAIT_MS = 200
+
+# Consecutive scans rejected by the text gate before the preview slows down
+IDLE_AFTER_EMPTY_SCANS = 3
+
 
 class MedicineScanner:
     """Real-time medicine scanner using camera, OCR, and LLM analysis."""
 
+    # Results panel size in pixels and background color
+    PANEL_WIDTH = 500
+    PANEL_HEIGHT = 280
+    PANEL_COLOR = (40, 40, 40)
+    # Gap between the panel and the right edge of the frame
+    PANEL_RIGHT_GAP = 20
+    # Border pixels drawn outside the panel rectangle
+    PANEL_BORDER_MARGIN = 2
+
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize the medicine scanner.
@@ -48,45 +65,86 @@ class MedicineScanner:
         
         # Scanner state
         self.last_scan_time = 0
-        self.scan_interval = self.config.get_scan_interval()
+        self.scan_interval = self.config.scan_interval
+        self.frame_interval = 1.0 / self.config.scanner_target_fps
         self.last_detected_medicine = None
         self.last_analysis = None
+        self._info_lines_cache: Optional[List[str]] = None
+        
+        # Solid results panel background, blended over the frame each draw
+        self._panel_solid = np.full(
+            (self.PANEL_HEIGHT, self.PANEL_WIDTH, 3), self.PANEL_COLOR, np.uint8
+        )
+        # Panel border and text, rendered once per result
+        self._panel_cache_key: Optional[tuple] = None
+        self._panel_cache_img: Optional[np.ndarray] = None
+        self._panel_cache_mask: Optional[np.ndarray] = None
+        
+        # OCR and LLM analysis run on a worker thread so the preview stays live
+        self._scan_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._result_queue: queue.Queue = queue.Queue()
+        # Scans in a row whose frame had no text-like content
+        self._empty_scans = 0
+        self._scan_thread = threading.Thread(target=self._scan_worker, daemon=True)
+        self._scan_thread.start()
         
         logger.info("Medicine Scanner initialized successfully")
 
     def _initialize_ocr(self) -> None:
         """Initialize the OCR reader."""
-        languages = self.config.get_ocr_languages()
-        confidence_threshold = self.config.get_ocr_confidence_threshold()
+        languages = self.config.ocr_languages
+        confidence_threshold = self.config.ocr_confidence_threshold
+        use_gpu = self.config.ocr_use_gpu
+        # OCR only sees the ROI downscaled to max_image_side, so the detector
+        # canvas never has to grow past it
+        canvas_size = self.config.ocr_max_image_side
         
         self.ocr_reader = OCRReader(
             languages=languages,
-            confidence_threshold=confidence_threshold
+            confidence_threshold=confidence_threshold,
+            gpu=use_gpu,
+            canvas_size=canvas_size,
+            mag_ratio=1.0,
+            jit=self.config.ocr_jit,
+            jit_cache_dir=str(self.config.jit_cache_path)
         )
 
     def _initialize_llm(self) -> None:
         """Initialize the LLM analyzer."""
-        api_key = self.config.get_openai_api_key()
-        model = self.config.get_openai_model()
-        temperature = self.config.get_openai_temperature()
-        max_tokens = self.config.get_openai_max_tokens()
+        api_key = self.config.openai_api_key
+        model = self.config.openai_model
+        temperature = self.config.openai_temperature
+        max_tokens = self.config.openai_max_tokens
+        top_p = self.config.openai_top_p
+        frequency_penalty = self.config.openai_frequency_penalty
+        presence_penalty = self.config.openai_presence_penalty
+        cache_size = self.config.analysis_cache_size
+        max_retries = self.config.openai_max_retries
         
         self.llm_analyzer = MedicineLLMAnalyzer(
             api_key=api_key,
             model=model,
             temperature=temperature,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            top_p=top_p,
+            frequency_penalty=frequency_penalty,
+            presence_penalty=presence_penalty,
+            cache_size=cache_size,
+            max_retries=max_retries
         )
+        
+        # Reuse analyses from earlier sessions instead of asking the LLM again
+        self.llm_analyzer.load_cache(self.config.analysis_cache_path)
 
     def _initialize_database(self) -> None:
         """Initialize the medicine database."""
-        db_path = self.config.get_medicine_database_path()
+        db_path = self.config.medicine_database_path
         self.medicine_db = MedicineDatabase(str(db_path))
         logger.info(f"Loaded {self.medicine_db.count()} medicines from database")
 
     def _initialize_camera(self) -> None:
         """Initialize the camera capture."""
-        camera_index = self.config.get_camera_index()
+        camera_index = self.config.camera_index
         self.camera_capture = cv.VideoCapture(camera_index)
         
         if not self.camera_capture.isOpened():
@@ -94,10 +152,20 @@ class MedicineScanner:
             raise RuntimeError(f"Could not open camera at index {camera_index}")
         
         # Set camera resolution
-        width, height = self.config.get_camera_resolution()
+        width, height = self.config.camera_resolution
         self.camera_capture.set(cv.CAP_PROP_FRAME_WIDTH, width)
         self.camera_capture.set(cv.CAP_PROP_FRAME_HEIGHT, height)
         
+        # Keep the driver from queueing stale frames behind the live view
+        buffer_size = self.config.camera_buffer_size
+        self._camera_buffer_limited = self.camera_capture.set(cv.CAP_PROP_BUFFERSIZE, buffer_size)
+        if not self._camera_buffer_limited:
+            logger.warning("Camera backend ignored buffer size; scans will drain stale frames")
+        
+        # Static UI chrome, rendered once the frame size is known
+        self._static_overlay: Optional[np.ndarray] = None
+        self._static_overlay_mask: Optional[np.ndarray] = None
+        
         logger.info(f"Camera initialized: {width}x{height}")
 
     def _should_scan(self) -> bool:
@@ -110,85 +178,217 @@ class MedicineScanner:
         current_time = time.time()
         return (current_time - self.last_scan_time) >= self.scan_interval
 
-    def _detect_medicine_from_frame(self, frame: np.ndarray) -> Optional[str]:
+    def _get_roi_bounds(self, width: int, height: int) -> Tuple[int, int, int, int]:
+        """
+        Get the centered region of the frame that is sent to OCR.
+
+        Args:
+            width: Frame width in pixels.
+            height: Frame height in pixels.
+
+        Returns:
+            Tuple of (x, y, roi_width, roi_height).
+        """
+        width_fraction, height_fraction = self.config.ocr_roi
+        roi_width = int(width * width_fraction)
+        roi_height = int(height * height_fraction)
+        x = (width - roi_width) // 2
+        y = (height - roi_height) // 2
+        return (x, y, roi_width, roi_height)
+
+    def _prepare_ocr_frame(self, frame: np.ndarray) -> np.ndarray:
         """
-        Detect medicine name from a video frame using OCR.
+        Crop a frame to the OCR region and downscale it.
+
+        EasyOCR's detection cost grows with pixel count, so only the
+        centered region the user aims at is read, at no more than the
+        configured maximum side length.
 
         Args:
             frame: Video frame as numpy array.
 
         Returns:
-            Detected medicine name or None.
+            Cropped and downscaled frame.
         """
-        # Extract text from frame
-        text_results = self.ocr_reader.read_text_from_frame(frame)
+        height, width = frame.shape[:2]
+        x, y, roi_width, roi_height = self._get_roi_bounds(width, height)
+        roi = frame[y:y + roi_height, x:x + roi_width]
         
-        if not text_results:
-            return None
+        scale = self.config.ocr_max_image_side / max(roi_width, roi_height)
+        if scale < 1.0:
+            roi = cv.resize(roi, None, fx=scale, fy=scale, interpolation=cv.INTER_AREA)
+        
+        return roi
+
+    def _frame_has_text_like_content(self, frame: np.ndarray) -> bool:
+        """
+        Cheaply check whether a frame could contain readable text.
+
+        Blank or defocused views (nothing held up to the camera) have few
+        edges and a low Laplacian variance, and are rejected in about a
+        millisecond instead of paying for a full OCR pass.
+
+        Args:
+            frame: Cropped and downscaled OCR input.
+
+        Returns:
+            True if the frame has enough sharp edges to be worth reading.
+        """
+        min_edge_pixels, min_sharpness = self.config.ocr_text_gate
+        gray = cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
+        
+        edges = cv.Canny(gray, 80, 160)
+        if cv.countNonZero(edges) <= min_edge_pixels:
+            return False
+        
+        return cv.Laplacian(gray, cv.CV_64F).var() > min_sharpness
+
+    def _detect_medicines_from_frame(self, frame: np.ndarray) -> List[str]:
+        """
+        Detect candidate medicine names from a video frame using OCR.
+
+        Args:
+            frame: Video frame as numpy array.
+
+        Returns:
+            The detected medicine name first, followed by any other
+            database matches in the frame. Empty if nothing was detected.
+        """
+        # Extract text from the region of interest only
+        ocr_frame = self._prepare_ocr_frame(frame)
+        if not self._frame_has_text_like_content(ocr_frame):
+            logger.debug("Skipping OCR: no text-like content in scan region")
+            self._empty_scans += 1
+            return []
+        self._empty_scans = 0
+        
+        text_results = self.ocr_reader.read_text_from_frame(ocr_frame)
         
-        # Try to match each detected text with medicine database
-        for text, confidence in text_results:
+        if not text_results:
+            return []
+        
+        # Clean the text
+        texts_cleaned = [text.strip() for text, _ in text_results]
+        
+        # Match all detected text against the medicine database in one pass,
+        # skipping text no medicine name is close enough in length to match
+        searchable = [i for i, text_cleaned in enumerate(texts_cleaned)
+                      if self.medicine_db.might_contain(text_cleaned)]
+        matched_medicines: List[Optional[str]] = [None] * len(texts_cleaned)
+        if searchable:
+            search_results = self.medicine_db.search_batch(
+                [texts_cleaned[i] for i in searchable]
+            )
+            for i, matched_medicine in zip(searchable, search_results):
+                matched_medicines[i] = matched_medicine
+        
+        candidates: List[str] = []
+        for (text, confidence), text_cleaned, matched_medicine in zip(
+                text_results, texts_cleaned, matched_medicines):
             logger.debug(f"Detected text: '{text}' (confidence: {confidence:.2f})")
             
-            # Clean the text
-            text_cleaned = text.strip()
-            
-            # Try to find in database
-            matched_medicine = self.medicine_db.search_medicine(text_cleaned)
-            
             if matched_medicine:
-                return matched_medicine
+                if matched_medicine not in candidates:
+                    candidates.append(matched_medicine)
             
-            # If not in database but has high confidence, might be a medicine
-            if confidence > 0.7 and len(text_cleaned) > 3:
-                return text_cleaned
+            # If not in database but has high confidence, might be a medicine.
+            # Unverified text is only used when nothing better came first.
+            elif not candidates and confidence > 0.7 and len(text_cleaned) > 3:
+                candidates.append(text_cleaned)
         
-        return None
+        return candidates
+
+    def _get_database_analysis(self, medicine_name: str) -> Optional[dict]:
+        """
+        Get a complete analysis from the medicine database, if it has one.
 
-    def _analyze_medicine_with_llm(self, medicine_name: str) -> dict:
+        Args:
+            medicine_name: Name of the medicine.
+
+        Returns:
+            Dictionary with medicine analysis, or None if the database does
+            not store every field shown in the results panel.
         """
-        Analyze medicine using LLM.
+        record = self.medicine_db.get_record(medicine_name)
+        if record is None or not all(record.get(field) for field in RECORD_COLUMNS):
+            return None
+        return record
+
+    def _analyze_medicines_with_llm(self, medicine_names: List[str]) -> List[dict]:
+        """
+        Analyze several medicines using concurrent LLM calls.
 
         Args:
-            medicine_name: Name of the medicine to analyze.
+            medicine_names: Names of the medicines to analyze.
 
         Returns:
-            Dictionary with medicine analysis.
+            List of medicine analyses in the same order as the names.
+        """
+        return self.llm_analyzer.analyze_many(medicine_names)
+
+    def _get_static_overlay(self, width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
         """
-        return self.llm_analyzer.analyze_medicine(medicine_name)
+        Get the static UI chrome, rendering it on first use for a frame size.
+
+        Args:
+            width: Frame width in pixels.
+            height: Frame height in pixels.
+
+        Returns:
+            Tuple of (BGR overlay, mask of drawn pixels) for np.copyto.
+        """
+        if self._static_overlay is not None and self._static_overlay.shape[:2] == (height, width):
+            return self._static_overlay[:, :, :3], self._static_overlay_mask
+        
+        # Alpha channel records which pixels were drawn
+        overlay = np.zeros((height, width, 4), np.uint8)
+        
+        # Draw title bar
+        cv.rectangle(overlay, (0, 0), (width, 60), (50, 50, 50, 255), -1)
+        cv.putText(overlay, "PharmaSee - Medicine Scanner", 
+                   (10, 40), cv.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255, 255), 2)
+        
+        # Draw the region that is scanned so the user can aim
+        roi_x, roi_y, roi_width, roi_height = self._get_roi_bounds(width, height)
+        cv.rectangle(overlay, (roi_x, roi_y),
+                    (roi_x + roi_width, roi_y + roi_height),
+                    (0, 255, 255, 255), 2)
+        
+        # Draw instructions
+        instructions = "Press 'S' to scan | 'Q' to quit | 'R' to reset"
+        cv.putText(overlay, instructions, 
+                   (10, height - 20), cv.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255, 255), 1)
+        
+        self._static_overlay = overlay
+        self._static_overlay_mask = overlay[:, :, 3:] > 0
+        return overlay[:, :, :3], self._static_overlay_mask
 
     def _draw_ui_elements(self, frame: np.ndarray, 
                           medicine_name: Optional[str],
                           analysis: Optional[dict]) -> np.ndarray:
         """
-        Draw UI elements on the frame.
+        Draw UI elements onto the frame in place.
 
         Args:
-            frame: Video frame to draw on.
+            frame: Video frame to draw on. Copy it first if the raw image is
+                   still needed, e.g. for scanning.
             medicine_name: Detected medicine name (if any).
             analysis: LLM analysis results (if any).
 
         Returns:
-            Frame with UI elements drawn.
+            The same frame, with UI elements drawn.
         """
-        frame_copy = frame.copy()
-        height, width = frame_copy.shape[:2]
-        
-        # Draw title bar
-        cv.rectangle(frame_copy, (0, 0), (width, 60), (50, 50, 50), -1)
-        cv.putText(frame_copy, "PharmaSee - Medicine Scanner", 
-                   (10, 40), cv.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255), 2)
+        height, width = frame.shape[:2]
         
-        # Draw instructions
-        instructions = "Press 'S' to scan | 'Q' to quit | 'R' to reset"
-        cv.putText(frame_copy, instructions, 
-                   (10, height - 20), cv.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+        # Blit the title bar, scan region and instructions, which never change
+        overlay, mask = self._get_static_overlay(width, height)
+        np.copyto(frame, overlay, where=mask)
         
         # Draw results panel if medicine detected
         if medicine_name and analysis:
-            self._draw_results_panel(frame_copy, medicine_name, analysis)
+            self._draw_results_panel(frame, medicine_name, analysis)
         
-        return frame_copy
+        return frame
 
     def _draw_results_panel(self, frame: np.ndarray, 
                            medicine_name: str, 
@@ -204,44 +404,112 @@ class MedicineScanner:
         height, width = frame.shape[:2]
         
         # Panel dimensions
-        panel_width = 500
-        panel_height = 280
-        panel_x = width - panel_width - 20
+        panel_width = self.PANEL_WIDTH
+        panel_height = self.PANEL_HEIGHT
+        panel_x = width - panel_width - self.PANEL_RIGHT_GAP
         panel_y = 80
         
-        # Draw semi-transparent panel
-        overlay = frame.copy()
-        cv.rectangle(overlay, (panel_x, panel_y), 
-                    (panel_x + panel_width, panel_y + panel_height),
-                    (40, 40, 40), -1)
-        cv.addWeighted(overlay, 0.85, frame, 0.15, 0, frame)
+        # Draw semi-transparent panel, blending only the part inside the frame
+        x0, y0 = max(panel_x, 0), max(panel_y, 0)
+        x1 = min(panel_x + panel_width, width)
+        y1 = min(panel_y + panel_height, height)
+        if x1 > x0 and y1 > y0:
+            roi = frame[y0:y1, x0:x1]
+            solid = self._panel_solid[y0 - panel_y:y1 - panel_y, x0 - panel_x:x1 - panel_x]
+            cv.addWeighted(solid, 0.85, roi, 0.15, 0, roi)
+        
+        # Blit the border and text, which only change with the result
+        layer, mask = self._get_panel_layer(medicine_name, analysis)
+        layer_x = panel_x - self.PANEL_BORDER_MARGIN
+        layer_y = panel_y - self.PANEL_BORDER_MARGIN
+        x0, y0 = max(layer_x, 0), max(layer_y, 0)
+        x1 = min(layer_x + layer.shape[1], width)
+        y1 = min(layer_y + layer.shape[0], height)
+        if x1 > x0 and y1 > y0:
+            np.copyto(
+                frame[y0:y1, x0:x1],
+                layer[y0 - layer_y:y1 - layer_y, x0 - layer_x:x1 - layer_x],
+                where=mask[y0 - layer_y:y1 - layer_y, x0 - layer_x:x1 - layer_x]
+            )
+
+    def _get_panel_layer(self, medicine_name: str,
+                         analysis: dict) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the results panel border and text, rendering them on first use for a result.
+
+        The layer's origin is PANEL_BORDER_MARGIN pixels above and left of
+        the panel, since the border is drawn centered on the panel edge.
+
+        Args:
+            medicine_name: Detected medicine name.
+            analysis: LLM analysis results.
+
+        Returns:
+            Tuple of (BGR layer, mask of drawn pixels) for np.copyto.
+        """
+        key = (medicine_name, tuple(sorted(analysis.items())))
+        if key == self._panel_cache_key:
+            return self._panel_cache_img[:, :, :3], self._panel_cache_mask
+        
+        margin = self.PANEL_BORDER_MARGIN
+        panel_width = self.PANEL_WIDTH
+        panel_height = self.PANEL_HEIGHT
+        
+        # Text may run past the panel up to the edge of the frame.
+        # The alpha channel records which pixels were drawn.
+        layer = np.zeros(
+            (panel_height + 2 * margin + 1,
+             panel_width + margin + self.PANEL_RIGHT_GAP, 4),
+            np.uint8
+        )
         
         # Draw border
-        cv.rectangle(frame, (panel_x, panel_y), 
-                    (panel_x + panel_width, panel_y + panel_height),
-                    (0, 255, 0), 2)
+        cv.rectangle(layer, (margin, margin), 
+                    (margin + panel_width, margin + panel_height),
+                    (0, 255, 0, 255), 2)
         
         # Draw title
-        cv.putText(frame, "MEDICINE DETECTED", 
-                   (panel_x + 10, panel_y + 30),
-                   cv.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
+        cv.putText(layer, "MEDICINE DETECTED", 
+                   (margin + 10, margin + 30),
+                   cv.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0, 255), 2)
         
         # Draw medicine information
-        y_offset = panel_y + 70
+        y_offset = margin + 70
         line_height = 35
         
-        info_lines = [
+        info_lines = self._info_lines_cache
+        if info_lines is None:
+            info_lines = self._format_info_lines(medicine_name, analysis)
+        
+        for i, line in enumerate(info_lines):
+            cv.putText(layer, line, 
+                      (margin + 15, y_offset + i * line_height),
+                      cv.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255, 255), 1)
+        
+        self._panel_cache_key = key
+        self._panel_cache_img = layer
+        self._panel_cache_mask = layer[:, :, 3:] > 0
+        return layer[:, :, :3], self._panel_cache_mask
+
+    @staticmethod
+    def _format_info_lines(medicine_name: str, analysis: dict) -> List[str]:
+        """
+        Format the lines of medicine information shown in the results panel.
+
+        Args:
+            medicine_name: Detected medicine name.
+            analysis: LLM analysis results.
+
+        Returns:
+            List of display lines.
+        """
+        return [
             f"Name: {medicine_name}",
             f"Type: {analysis.get('type', 'Unknown')}",
             f"Use: {analysis.get('use', 'Unknown')[:40]}...",
             f"Class: {analysis.get('drug_class', 'Unknown')}",
             f"Form: {analysis.get('form', 'Unknown')}"
         ]
-        
-        for i, line in enumerate(info_lines):
-            cv.putText(frame, line, 
-                      (panel_x + 15, y_offset + i * line_height),
-                      cv.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
 
     def run(self) -> None:
         """Run the medicine scanner application."""
@@ -257,6 +525,8 @@ class MedicineScanner:
         
         try:
             while True:
+                frame_start = time.monotonic()
+                
                 # Read frame from camera
                 frame_read_success, frame = self.camera_capture.read()
                 
@@ -264,6 +534,18 @@ class MedicineScanner:
                     logger.error("Failed to read frame from camera")
                     break
                 
+                # Pick up any scan finished by the worker
+                self._collect_scan_results()
+                
+                # Checked before the UI is drawn, since the scan box outline
+                # would look like text-like edges
+                idle = self._is_idle(frame)
+                
+                # Auto-scan at intervals. The frame is queued (and copied)
+                # before the UI is drawn onto it, so OCR never sees the overlay.
+                if self._should_scan():
+                    self._request_scan(frame)
+                
                 # Draw UI elements
                 display_frame = self._draw_ui_elements(
                     frame, 
@@ -274,8 +556,9 @@ class MedicineScanner:
                 # Display the frame
                 cv.imshow("PharmaSee - Medicine Scanner", display_frame)
                 
-                # Handle keyboard input
-                key = cv.waitKey(1) & 0xFF
+                # Handle keyboard input, sleeping out the rest of the frame
+                # instead of busy-polling. waitKey returns early on a key press.
+                key = cv.waitKey(self._get_wait_ms(frame_start, idle)) & 0xFF
                 
                 if key == ord('q') or key == ord('Q'):
                     logger.info("Quit requested by user")
@@ -283,16 +566,20 @@ class MedicineScanner:
                 
                 elif key == ord('s') or key == ord('S'):
                     logger.info("Manual scan triggered")
-                    self._perform_scan(frame)
+                    # Discard a possibly buffered frame so the scan matches the live view
+                    if not self._camera_buffer_limited:
+                        self.camera_capture.grab()
+                    frame_read_success, scan_frame = self.camera_capture.read()
+                    if frame_read_success:
+                        self._request_scan(scan_frame)
+                    else:
+                        logger.warning("Failed to read frame for manual scan")
                 
                 elif key == ord('r') or key == ord('R'):
                     logger.info("Reset detection")
                     self.last_detected_medicine = None
                     self.last_analysis = None
-                
-                # Auto-scan at intervals
-                elif self._should_scan():
-                    self._perform_scan(frame)
+                    self._info_lines_cache = None
         
         except KeyboardInterrupt:
             logger.info("Application interrupted by user")
@@ -303,32 +590,129 @@ class MedicineScanner:
         finally:
             self._cleanup()
 
-    def _perform_scan(self, frame: np.ndarray) -> None:
+    def _is_idle(self, frame: np.ndarray) -> bool:
         """
-        Perform medicine detection and analysis on a frame.
+        Check whether the camera has shown nothing worth scanning for a while.
+
+        Only after several scans in a row were rejected by the text gate is
+        the live frame checked with the same gate, so anything coming into
+        view ends the idle state on the next frame.
+
+        Args:
+            frame: Raw video frame, before the UI is drawn on it.
+
+        Returns:
+            True if the preview can poll at the slower idle rate.
+        """
+        if self._empty_scans < IDLE_AFTER_EMPTY_SCANS:
+            return False
+        
+        if self._frame_has_text_like_content(self._prepare_ocr_frame(frame)):
+            self._empty_scans = 0
+            return False
+        return True
+
+    def _get_wait_ms(self, frame_start: float, idle: bool = False) -> int:
+        """
+        Get how long to wait for a key press before the next frame.
+
+        Args:
+            frame_start: time.monotonic() value when the frame was read.
+            idle: Whether the camera has shown nothing worth scanning for a while.
+
+        Returns:
+            Wait time in milliseconds (at least 1, as 0 blocks forever).
+        """
+        if idle:
+            return IDLE_WAIT_MS
+        
+        remaining = self.frame_interval - (time.monotonic() - frame_start)
+        return max(1, int(remaining * 1000))
+
+    def _request_scan(self, frame: np.ndarray) -> None:
+        """
+        Queue a frame for the scan worker without blocking the UI.
+
+        Only one frame waits at a time; a newer request replaces a pending
+        one so the worker always scans the freshest frame.
 
         Args:
             frame: Video frame to scan.
         """
         self.last_scan_time = time.time()
+        scan_frame = frame.copy()
         
+        try:
+            self._scan_queue.put_nowait(scan_frame)
+        except queue.Full:
+            try:
+                self._scan_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._scan_queue.put_nowait(scan_frame)
+
+    def _collect_scan_results(self) -> None:
+        """Apply results the scan worker has finished since the last frame."""
+        while True:
+            try:
+                medicine_name, analysis = self._result_queue.get_nowait()
+            except queue.Empty:
+                return
+            
+            self.last_detected_medicine = medicine_name
+            self.last_analysis = analysis
+            self._info_lines_cache = self._format_info_lines(medicine_name, analysis)
+
+    def _scan_worker(self) -> None:
+        """Scan queued frames until a None stop signal is received."""
+        while True:
+            frame = self._scan_queue.get()
+            if frame is None:
+                break
+            
+            try:
+                result = self._perform_scan(frame)
+            except Exception as e:
+                logger.error(f"Error during scan: {e}", exc_info=True)
+                result = None
+            
+            if result is not None:
+                self._result_queue.put(result)
+
+    def _perform_scan(self, frame: np.ndarray) -> Optional[Tuple[str, dict]]:
+        """
+        Perform medicine detection and analysis on a frame.
+
+        Args:
+            frame: Video frame to scan.
+
+        Returns:
+            Tuple of (medicine_name, analysis), or None if no medicine detected.
+        """
         logger.info("Scanning for medicine...")
         print("\n🔍 Scanning for medicine...")
         
         # Detect medicine from frame
-        medicine_name = self._detect_medicine_from_frame(frame)
+        medicine_names = self._detect_medicines_from_frame(frame)
         
-        if medicine_name:
+        if medicine_names:
+            medicine_name = medicine_names[0]
             logger.info(f"Medicine detected: {medicine_name}")
             print(f"✓ Medicine detected: {medicine_name}")
-            print("🤖 Analyzing with AI...")
             
-            # Analyze with LLM
-            analysis = self._analyze_medicine_with_llm(medicine_name)
+            # Other medicines in view are analyzed in the background so they
+            # are already cached when shown next, without delaying this result.
+            # Medicines fully described by the database need no LLM call.
+            unanalyzed = [name for name in medicine_names[1:]
+                          if self._get_database_analysis(name) is None]
+            if unanalyzed:
+                self.llm_analyzer.prefetch(unanalyzed)
             
-            # Store results
-            self.last_detected_medicine = medicine_name
-            self.last_analysis = analysis
+            analysis = self._get_database_analysis(medicine_name)
+            if analysis is None:
+                # Analyze with LLM
+                print("🤖 Analyzing with AI...")
+                analysis = self._analyze_medicines_with_llm([medicine_name])[0]
             
             # Print results to console
             print("\n" + "─"*50)
@@ -338,14 +722,29 @@ class MedicineScanner:
             print(f"Drug Class: {analysis.get('drug_class', 'Unknown')}")
             print(f"Common Form: {analysis.get('form', 'Unknown')}")
             print("─"*50 + "\n")
-        else:
-            logger.info("No medicine detected in frame")
-            print("✗ No medicine detected. Please try again.\n")
+            
+            return (medicine_name, analysis)
+        
+        logger.info("No medicine detected in frame")
+        print("✗ No medicine detected. Please try again.\n")
+        return None
 
     def _cleanup(self) -> None:
         """Clean up resources."""
         logger.info("Cleaning up resources...")
         
+        if hasattr(self, '_scan_thread'):
+            # Drop any pending frame so the stop signal fits in the queue
+            try:
+                self._scan_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._scan_queue.put(None)
+            self._scan_thread.join(timeout=5)
+        
+        if hasattr(self, 'llm_analyzer'):
+            self.llm_analyzer.save_cache(self.config.analysis_cache_path)
+        
         if hasattr(self, 'camera_capture') and self.camera_capture is not None:
             self.camera_capture.release()
         
@@ -0,0 +1,217 @@
+"""
+OCR Pool Module
+
+This module runs EasyOCR in several worker processes so that batches of
+images can be read in parallel instead of one at a time.
+"""
+
+import logging
+import multiprocessing as mp
+import queue
+import time
+from typing import Any, Iterator, List, Optional, Tuple
+
+import easyocr
+import numpy as np
+
+from config_manager import ConfigManager
+from ocr_reader import cuda_available
+
+logger = logging.getLogger(__name__)
+
+# Seconds between worker liveness checks while waiting for results
+WORKER_POLL_INTERVAL = 0.5
+
+
+def _ocr_worker(languages: List[str], gpu: bool,
+                input_queue: mp.Queue, output_queue: mp.Queue) -> None:
+    """
+    Read images from the input queue until a stop signal arrives.
+
+    Each worker builds its own Reader once at startup, so the model load
+    cost is paid per process rather than per image.
+
+    Args:
+        languages: List of language codes for OCR.
+        gpu: Whether EasyOCR should use the GPU.
+        input_queue: Queue of (frame_id, image) items, or None to stop.
+        output_queue: Queue receiving (frame_id, ocr_result, error) items.
+                      A worker that cannot load its Reader sends a single
+                      item with the error message and exits.
+    """
+    try:
+        reader = easyocr.Reader(languages, gpu=gpu)
+    except Exception as e:
+        logger.error(f"Failed to initialize OCR worker: {e}")
+        output_queue.put((None, [], str(e)))
+        return
+
+    while True:
+        item = input_queue.get()
+        if item is None:
+            break
+
+        frame_id, image = item
+        try:
+            result = reader.readtext(image)
+        except Exception as e:
+            logger.error(f"Error reading text in OCR worker: {e}")
+            result = []
+
+        output_queue.put((frame_id, result, None))
+
+
+class OCRPool:
+    """Pool of EasyOCR worker processes for batch text extraction."""
+
+    def __init__(self, languages: List[str] = None, workers: int = 2, gpu: bool = False):
+        """
+        Start the OCR worker processes.
+
+        Args:
+            languages: List of language codes for OCR (default: ['en']).
+            workers: Number of worker processes to start.
+            gpu: Whether the workers should run EasyOCR on the GPU.
+
+        Raises:
+            ValueError: If workers is less than 1.
+        """
+        if workers < 1:
+            raise ValueError(f"OCRPool needs at least one worker, got {workers}")
+
+        if languages is None:
+            languages = ['en']
+
+        # Forking a process that has already initialized PyTorch is unsafe
+        context = mp.get_context('spawn')
+        self._input_queue = context.Queue()
+        self._output_queue = context.Queue()
+        self._pending = 0
+
+        logger.info(f"Starting {workers} OCR worker processes")
+        self._processes = [
+            context.Process(
+                target=_ocr_worker,
+                args=(languages, gpu, self._input_queue, self._output_queue),
+                daemon=True
+            )
+            for _ in range(workers)
+        ]
+        for process in self._processes:
+            process.start()
+
+    @classmethod
+    def from_config(cls, config: ConfigManager) -> "OCRPool":
+        """
+        Start a pool using the OCR and scanner settings.
+
+        Args:
+            config: Loaded configuration (scanner.workers, ocr.languages
+                    and ocr.use_gpu are used).
+
+        Returns:
+            Started OCRPool.
+        """
+        gpu = config.ocr_use_gpu
+        if gpu is None:
+            gpu = cuda_available()
+        return cls(
+            languages=config.ocr_languages,
+            workers=config.scanner_workers,
+            gpu=gpu
+        )
+
+    def submit(self, frame_id: Any, image: np.ndarray) -> None:
+        """
+        Queue an image for OCR.
+
+        Args:
+            frame_id: Identifier returned alongside the result.
+            image: Image as numpy array (or path to an image file).
+        """
+        self._input_queue.put((frame_id, image))
+        self._pending += 1
+
+    def get_result(self, timeout: Optional[float] = None) -> Optional[Tuple[Any, list]]:
+        """
+        Get the next finished OCR result.
+
+        Args:
+            timeout: Seconds to wait, or None to block until a result is ready.
+
+        Returns:
+            Tuple of (frame_id, ocr_result), or None if nothing is pending
+            or the timeout expired.
+
+        Raises:
+            RuntimeError: If a worker failed to start or exited, since its
+                          images would otherwise never be answered.
+        """
+        if self._pending == 0:
+            return None
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = WORKER_POLL_INTERVAL
+            if deadline is not None:
+                wait = min(wait, max(0.0, deadline - time.monotonic()))
+
+            try:
+                frame_id, result, error = self._output_queue.get(timeout=wait)
+                break
+            except queue.Empty:
+                if not all(process.is_alive() for process in self._processes):
+                    raise RuntimeError("OCR worker process exited unexpectedly")
+                if deadline is not None and time.monotonic() >= deadline:
+                    return None
+
+        if error is not None:
+            raise RuntimeError(f"OCR worker failed to start: {error}")
+
+        self._pending -= 1
+        return (frame_id, result)
+
+    def results(self) -> Iterator[Tuple[Any, list]]:
+        """
+        Iterate over results of all submitted images as they finish.
+
+        Returns:
+            Iterator of (frame_id, ocr_result) tuples in completion order.
+        """
+        while self._pending > 0:
+            yield self.get_result()
+
+    def read_batch(self, images: List[np.ndarray]) -> List[list]:
+        """
+        Run OCR on a batch of images and wait for all results.
+
+        Should not be mixed with outstanding submit() calls, since their
+        results would be collected here as well.
+
+        Args:
+            images: Images as numpy arrays (or image file paths).
+
+        Returns:
+            EasyOCR results in the same order as the images.
+        """
+        for index, image in enumerate(images):
+            self.submit(index, image)
+
+        ordered_results: List[list] = [[] for _ in images]
+        for index, result in self.results():
+            ordered_results[index] = result
+        return ordered_results
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        for _ in self._processes:
+            self._input_queue.put(None)
+        for process in self._processes:
+            process.join()
+        logger.info("OCR worker processes stopped")
+
+    def __enter__(self) -> "OCRPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -5,40 +5,362 @@ This module provides a wrapper around EasyOCR for text extraction
 from images with proper error handling and filtering.
 """
 
+import hashlib
 import logging
-from typing import List, Tuple, Optional
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Optional, Union
 
 import easyocr
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# EasyOCR readers shared by all OCRReader instances, keyed on
+# (languages, gpu, quantize, jit). Loading a reader takes seconds and its
+# models take tens of megabytes per copy.
+_reader_cache: Dict[tuple, easyocr.Reader] = {}
+_reader_cache_lock = threading.Lock()
+
+
+def cuda_available() -> bool:
+    """
+    Check whether PyTorch can use a CUDA device.
+
+    Returns:
+        True if CUDA is available, False otherwise (including when PyTorch
+        cannot be imported).
+    """
+    try:
+        import torch
+        return torch.cuda.is_available()
+    except Exception:
+        return False
+
+
+def _align32(value: int) -> int:
+    """Round a side length up to the multiple of 32 the text detector expects."""
+    return max(32, (value + 31) // 32 * 32)
+
+
+def _outputs_match(expected: Any, actual: Any, tolerance: float = 1e-3) -> bool:
+    """
+    Check that traced model outputs match the eager ones.
+
+    Args:
+        expected: Tensor or tuple of tensors from the eager model.
+        actual: Tensor or tuple of tensors from the traced model.
+        tolerance: Absolute and relative tolerance.
+
+    Returns:
+        True if every output has the same shape and values within tolerance.
+    """
+    import torch
+
+    if isinstance(expected, torch.Tensor):
+        expected, actual = (expected,), (actual,)
+    if len(expected) != len(actual):
+        return False
+    return all(
+        e.shape == a.shape and torch.allclose(e, a, rtol=tolerance, atol=tolerance)
+        for e, a in zip(expected, actual)
+    )
+
+
+def _trace_model(model: Any, example_inputs: tuple, check_inputs: tuple,
+                 path: Optional[Path]) -> Any:
+    """
+    Trace an EasyOCR model with TorchScript, reusing a saved trace if present.
+
+    The trace is checked against the eager model on inputs of a different
+    shape than it was traced with, so a trace that baked in the example
+    shape is rejected.
+
+    Args:
+        model: Eager PyTorch model (possibly wrapped in DataParallel).
+        example_inputs: Inputs to trace with.
+        check_inputs: Held-out inputs to validate the trace with.
+        path: File to load the trace from or save it to, or None to skip.
+
+    Returns:
+        Traced model, or the original model if tracing or validation failed.
+    """
+    import torch
+
+    module = getattr(model, 'module', model)
+    device = next(module.parameters()).device
+
+    try:
+        if path is not None and path.exists():
+            logger.info(f"Loading traced OCR model from {path}")
+            return torch.jit.load(str(path), map_location=device)
+
+        module.eval()
+        with torch.no_grad():
+            traced = torch.jit.freeze(torch.jit.trace(module, example_inputs))
+            if not _outputs_match(module(*check_inputs), traced(*check_inputs)):
+                logger.warning("Traced OCR model output differs; using eager model")
+                return model
+
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            torch.jit.save(traced, str(path))
+            logger.info(f"Saved traced OCR model to {path}")
+        return traced
+
+    except Exception as e:
+        logger.warning(f"Failed to trace OCR model, using eager model: {e}")
+        return model
+
+
+def _trace_reader(reader: easyocr.Reader, languages: List[str], canvas_size: int,
+                  quantize: bool, cache_dir: Optional[Path]) -> None:
+    """
+    Replace a reader's detector and recognizer with TorchScript traces.
+
+    Args:
+        reader: EasyOCR reader to modify.
+        languages: List of language codes the reader was loaded with.
+        canvas_size: Longest side in pixels of detector input.
+        quantize: Whether the reader uses quantized models.
+        cache_dir: Directory for saved traces, or None to trace every start.
+    """
+    try:
+        import torch
+    except ImportError as e:
+        logger.warning(f"PyTorch unavailable, using eager OCR models: {e}")
+        return
+
+    device = torch.device(reader.device)
+
+    def trace_path(name: str) -> Optional[Path]:
+        if cache_dir is None:
+            return None
+        quantized = '-quantized' if quantize and device.type == 'cpu' else ''
+        return Path(cache_dir) / (
+            f"{name}-{'-'.join(languages)}-{canvas_size}-{device.type}{quantized}"
+            f"-easyocr{easyocr.__version__}-torch{torch.__version__}.pt"
+        )
+
+    width = _align32(canvas_size)
+    height = _align32(canvas_size // 2)
+    reader.detector = _trace_model(
+        reader.detector,
+        (torch.rand(1, 3, height, width, device=device),),
+        (torch.rand(1, 3, _align32(height // 2), _align32(width // 2), device=device),),
+        trace_path('detector')
+    )
+
+    # The recognizer reads 64 pixel high text lines of any width
+    text = torch.zeros(1, 1, dtype=torch.long, device=device)
+    reader.recognizer = _trace_model(
+        reader.recognizer,
+        (torch.rand(1, 1, 64, 256, device=device), text),
+        (torch.rand(1, 1, 64, 160, device=device), text),
+        trace_path('recognizer')
+    )
+
+
+def _get_shared_reader(languages: List[str], gpu: bool, quantize: bool = True,
+                       jit: bool = False, canvas_size: int = 2560,
+                       jit_cache_dir: Optional[Path] = None) -> easyocr.Reader:
+    """
+    Get the EasyOCR reader for a configuration, loading it on first use.
+
+    Args:
+        languages: List of language codes for OCR.
+        gpu: Whether EasyOCR should use the GPU.
+        quantize: Whether to use dynamically quantized models on CPU.
+        jit: Whether to run the models as TorchScript traces.
+        canvas_size: Longest side in pixels of detector input, used for tracing.
+        jit_cache_dir: Directory for saved traces.
+
+    Returns:
+        Shared EasyOCR Reader instance.
+    """
+    key = (tuple(languages), bool(gpu), quantize, jit)
+    with _reader_cache_lock:
+        reader = _reader_cache.get(key)
+        if reader is None:
+            # cudnn_benchmark lets cuDNN tune its kernels for the fixed canvas size
+            reader = easyocr.Reader(
+                languages,
+                gpu=gpu,
+                quantize=quantize,
+                cudnn_benchmark=True
+            )
+            if jit:
+                _trace_reader(reader, languages, canvas_size, quantize, jit_cache_dir)
+            _reader_cache[key] = reader
+        else:
+            logger.info("Reusing loaded EasyOCR reader")
+    return reader
+
 
 class OCRReader:
     """Wrapper for EasyOCR with enhanced functionality."""
 
-    def __init__(self, languages: List[str] = None, confidence_threshold: float = 0.5):
+    def __init__(self, languages: List[str] = None, confidence_threshold: float = 0.5,
+                 gpu: Optional[bool] = None, canvas_size: int = 2560,
+                 mag_ratio: float = 1.0, jit: bool = False,
+                 jit_cache_dir: Optional[str] = None, result_cache_size: int = 8):
         """
         Initialize the OCR reader.
 
         Args:
             languages: List of language codes for OCR (default: ['en']).
             confidence_threshold: Minimum confidence score for accepting text.
+            gpu: Whether to run EasyOCR on the GPU. None uses the GPU when
+                 CUDA is available.
+            canvas_size: Longest side in pixels the text detector resizes
+                         images to. Matching it to the size of the images
+                         passed in avoids resizing them on every call.
+            mag_ratio: Image magnification ratio applied before detection.
+            jit: Whether to run the detector and recognizer as TorchScript
+                 traces. Falls back to the eager models if tracing fails or
+                 changes their output.
+            jit_cache_dir: Directory where traced models are saved and
+                           reused across runs (default: trace on every start).
+            result_cache_size: Number of recent OCR results kept, so reading
+                               the same image again skips OCR.
         """
         if languages is None:
             languages = ['en']
+        if gpu is None:
+            gpu = cuda_available()
         
         self.languages = languages
         self.confidence_threshold = confidence_threshold
+        self.gpu = gpu
+        self.canvas_size = canvas_size
+        self.mag_ratio = mag_ratio
         
-        logger.info(f"Initializing OCR Reader with languages: {languages}")
+        # Keeps the detector from resizing input that already fits the canvas
+        self._readtext_options = {
+            'canvas_size': canvas_size,
+            'mag_ratio': mag_ratio,
+        }
+        
+        # Filtered results of recent images, keyed on image content
+        self._result_cache: "OrderedDict[tuple, List[Tuple[str, float]]]" = OrderedDict()
+        self._result_cache_size = result_cache_size
+        self._result_cache_lock = threading.Lock()
+        
+        logger.info(f"Initializing OCR Reader with languages: {languages} (GPU: {gpu})")
         try:
-            self.reader = easyocr.Reader(languages, gpu=False)
+            self.reader = _get_shared_reader(
+                languages, gpu,
+                jit=jit,
+                canvas_size=canvas_size,
+                jit_cache_dir=Path(jit_cache_dir) if jit_cache_dir else None
+            )
             logger.info("OCR Reader initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize OCR Reader: {e}")
             raise
 
+    def _filter_results(self, results: list) -> List[Tuple[str, float]]:
+        """
+        Keep EasyOCR results at or above the confidence threshold.
+
+        Args:
+            results: Raw EasyOCR results as (bbox, text, confidence) tuples.
+
+        Returns:
+            List of tuples containing (text, confidence_score).
+        """
+        if not results:
+            return []
+
+        confidences = np.fromiter(
+            (result[2] for result in results), dtype=np.float64, count=len(results)
+        )
+        keep = np.flatnonzero(confidences >= self.confidence_threshold)
+        return [(results[i][1], float(confidences[i])) for i in keep]
+
+    @staticmethod
+    def _result_cache_key(src: Union[str, np.ndarray]) -> Optional[tuple]:
+        """
+        Build the result cache key for an image.
+
+        Arrays are keyed on shape, dtype and a hash of their pixels, and
+        files on path, size and modification time.
+
+        Args:
+            src: Image as numpy array or path to an image file.
+
+        Returns:
+            Cache key, or None if the image cannot be keyed.
+        """
+        if isinstance(src, np.ndarray):
+            digest = hashlib.blake2b(np.ascontiguousarray(src), digest_size=16).digest()
+            return (src.shape, src.dtype.str, digest)
+        
+        try:
+            stat = os.stat(src)
+        except (OSError, TypeError, ValueError):
+            return None
+        return (str(src), stat.st_size, stat.st_mtime_ns)
+
+    def _run(self, src: Union[str, np.ndarray]) -> List[Tuple[str, float]]:
+        """
+        Run OCR on an image, reusing the result for a recently read image.
+
+        Args:
+            src: Image as numpy array or path to an image file.
+
+        Returns:
+            List of tuples containing (text, confidence_score).
+        """
+        key = self._result_cache_key(src)
+        if key is not None:
+            with self._result_cache_lock:
+                cached = self._result_cache.get(key)
+                if cached is not None:
+                    self._result_cache.move_to_end(key)
+                    logger.debug("Using cached OCR result")
+                    return list(cached)
+        
+        results = self.reader.readtext(src, **self._readtext_options)
+        filtered_results = self._filter_results(results)
+        
+        logger.debug(
+            f"Extracted {len(filtered_results)} text items "
+            f"({len(results) - len(filtered_results)} below confidence threshold)"
+        )
+        
+        if key is not None and self._result_cache_size > 0:
+            with self._result_cache_lock:
+                self._result_cache[key] = filtered_results
+                self._result_cache.move_to_end(key)
+                while len(self._result_cache) > self._result_cache_size:
+                    self._result_cache.popitem(last=False)
+        
+        return list(filtered_results)
+
+    @staticmethod
+    def _highest_confidence(results: List[Tuple[str, float]]) -> Optional[Tuple[str, float]]:
+        """
+        Pick the result with the highest confidence score.
+
+        Args:
+            results: List of tuples containing (text, confidence_score).
+
+        Returns:
+            The first result with the highest confidence, or None if empty.
+        """
+        if not results:
+            return None
+        if len(results) == 1:
+            return results[0]
+        
+        confidences = np.fromiter(
+            (result[1] for result in results), dtype=np.float64, count=len(results)
+        )
+        return results[int(np.argmax(confidences))]
+
     def read_text_from_image(self, image_path: str) -> List[Tuple[str, float]]:
         """
         Extract text from an image file.
@@ -50,17 +372,7 @@ class OCRReader:
             List of tuples containing (text, confidence_score).
         """
         try:
-            results = self.reader.readtext(image_path)
-            
-            # Filter results by confidence threshold and extract text
-            filtered_results = [
-                (text, confidence)
-                for (_, text, confidence) in results
-                if confidence >= self.confidence_threshold
-            ]
-            
-            logger.debug(f"Extracted {len(filtered_results)} text items from image")
-            return filtered_results
+            return self._run(image_path)
 
         except Exception as e:
             logger.error(f"Error reading text from image: {e}")
@@ -77,17 +389,7 @@ class OCRReader:
             List of tuples containing (text, confidence_score).
         """
         try:
-            results = self.reader.readtext(frame)
-            
-            # Filter results by confidence threshold and extract text
-            filtered_results = [
-                (text, confidence)
-                for (_, text, confidence) in results
-                if confidence >= self.confidence_threshold
-            ]
-            
-            logger.debug(f"Extracted {len(filtered_results)} text items from frame")
-            return filtered_results
+            return self._run(frame)
 
         except Exception as e:
             logger.error(f"Error reading text from frame: {e}")
@@ -135,10 +437,7 @@ class OCRReader:
         """
         results = self.read_text_from_image(image_path)
         
-        if not results:
-            return None
-        
-        return max(results, key=lambda x: x[1])
+        return self._highest_confidence(results)
 
     def get_highest_confidence_text_from_frame(self, frame: np.ndarray) -> Optional[Tuple[str, float]]:
         """
@@ -152,9 +451,6 @@ class OCRReader:
         """
         results = self.read_text_from_frame(frame)
         
-        if not results:
-            return None
-        
-        return max(results, key=lambda x: x[1])
+        return self._highest_confidence(results)
 
 
@@ -4,8 +4,10 @@ Test Module for OCR and Medicine Scanner
 This module provides tests for the OCR functionality and medicine detection.
 """
 
+import json
 import logging
 import sys
+import tempfile
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -14,6 +16,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 from ocr_reader import OCRReader
 from medicine_database import MedicineDatabase
 from config_manager import ConfigManager
+from llm_analyzer import MedicineLLMAnalyzer
+from medicine_scanner import MedicineScanner
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -73,6 +77,138 @@ def test_medicine_database():
         print(f"✗ Error: {e}")
 
 
+def test_medicine_database_batch_search():
+    """Test that batch search matches searching one name at a time."""
+    print("\n" + "="*60)
+    print("Testing Medicine Database Batch Search")
+    print("="*60)
+    
+    db_path = Path(__file__).parent.parent / 'data' / 'medicines.csv'
+    db = MedicineDatabase(str(db_path))
+    
+    test_names = ["Aspirin", "Ibuprofn", "Lot 42"]
+    results = db.search_batch(test_names)
+    print(f"Batch search for {test_names}: {results}")
+    
+    assert results == ['Aspirin', 'Ibuprofen', None]
+    
+    # Compare against a fresh database so neither call reuses the other's cache
+    fresh_db = MedicineDatabase(str(db_path))
+    assert results == [fresh_db.search_medicine(name) for name in test_names]
+    print("✓ Batch search matches single searches")
+
+
+def test_medicine_database_might_contain():
+    """Test that the search prefilter never rejects text that would match."""
+    print("\n" + "="*60)
+    print("Testing Medicine Database Prefilter")
+    print("="*60)
+    
+    db_path = Path(__file__).parent.parent / 'data' / 'medicines.csv'
+    db = MedicineDatabase(str(db_path))
+    
+    # Misspellings sharing few or no trigrams with the name still pass
+    for test_name in ["Aspirin", "asirn", "isuin", "trmaol"]:
+        assert db.search_medicine(test_name) is not None
+        assert db.might_contain(test_name)
+    
+    # Text far longer than any medicine name cannot reach the threshold
+    label_text = "Store below 25C away from direct sunlight and moisture"
+    assert db.search_medicine(label_text) is None
+    assert not db.might_contain(label_text)
+    assert db.might_contain(label_text, threshold=0)
+    print("✓ Prefilter keeps every match")
+
+
+def test_medicine_database_records():
+    """Test metadata columns and the database analyses built from them."""
+    print("\n" + "="*60)
+    print("Testing Medicine Database Records")
+    print("="*60)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = Path(temp_dir) / 'medicines.csv'
+        db_path.write_text(
+            "name,type,use,drug_class,form,manufacturer\n"
+            "Aspirin,Analgesic,Pain relief,NSAID,Tablet,Acme\n"
+            "Ibuprofen, Analgesic ,,NSAID,\n"
+            "Cetirizine,,,,\n",
+            encoding='utf-8'
+        )
+        db = MedicineDatabase(str(db_path))
+    
+    assert db.count() == 3
+    assert db.get_record("Aspirin") == {
+        'type': 'Analgesic', 'use': 'Pain relief', 'drug_class': 'NSAID', 'form': 'Tablet'
+    }
+    assert db.get_record("Ibuprofen") == {'type': 'Analgesic', 'drug_class': 'NSAID'}
+    assert db.get_record("Cetirizine") is None
+    
+    # Only the database is needed, so skip the camera and API setup
+    scanner = MedicineScanner.__new__(MedicineScanner)
+    scanner.medicine_db = db
+    assert scanner._get_database_analysis("Aspirin") == db.get_record("Aspirin")
+    assert scanner._get_database_analysis("Ibuprofen") is None
+    assert scanner._get_database_analysis("Cetirizine") is None
+    print("✓ Records loaded and only complete ones skip the LLM")
+
+
+def test_llm_response_parsing():
+    """Test parsing JSON and "Key: value" LLM responses."""
+    print("\n" + "="*60)
+    print("Testing LLM Response Parsing")
+    print("="*60)
+    
+    analyzer = MedicineLLMAnalyzer(api_key="test-key")
+    unknown = {'type': 'Unknown', 'use': 'Unknown', 'drug_class': 'Unknown', 'form': 'Unknown'}
+    
+    parsed = analyzer._parse_llm_response(
+        '{"type": "Analgesic", "use": " Pain relief ", "drug_class": "NSAID", "form": "Tablet"}'
+    )
+    assert parsed == {'type': 'Analgesic', 'use': 'Pain relief', 'drug_class': 'NSAID', 'form': 'Tablet'}
+    
+    parsed = analyzer._parse_llm_response("Type: Analgesic\r\nUse: Pain relief\r\nClass: NSAID\r\n")
+    assert parsed == {'type': 'Analgesic', 'use': 'Pain relief', 'drug_class': 'NSAID', 'form': 'Unknown'}
+    
+    assert analyzer._parse_llm_response('{"type": "Analgesic", "use": "Pain rel') == unknown
+    assert analyzer._parse_llm_response('{"name": "Aspirin"}') == unknown
+    assert analyzer._parse_llm_response('') == unknown
+    print("✓ JSON, Key: value and malformed responses parsed")
+
+
+def test_llm_analysis_cache():
+    """Test the analysis cache round trip and LRU eviction."""
+    print("\n" + "="*60)
+    print("Testing LLM Analysis Cache")
+    print("="*60)
+    
+    analysis = {'type': 'Analgesic', 'use': 'Pain relief', 'drug_class': 'NSAID', 'form': 'Tablet'}
+    analyzer = MedicineLLMAnalyzer(api_key="test-key", cache_size=2)
+    analyzer._store_analysis('aspirin', analysis)
+    analyzer._store_analysis('ibuprofen', analysis)
+    # Using aspirin makes ibuprofen the least recently used entry
+    assert analyzer._get_cached_analysis(' Aspirin') == analysis
+    analyzer._store_analysis('naproxen', analysis)
+    assert analyzer._get_cached_analysis('Ibuprofen') is None
+    assert list(analyzer._cache) == ['aspirin', 'naproxen']
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_path = Path(temp_dir) / 'analysis_cache.json'
+        analyzer.save_cache(cache_path)
+        assert json.loads(cache_path.read_text(encoding='utf-8')) == {
+            'aspirin': analysis, 'naproxen': analysis
+        }
+        
+        loaded = MedicineLLMAnalyzer(api_key="test-key", cache_size=1)
+        loaded.load_cache(cache_path)
+        # Loading into a smaller cache keeps the most recently used entries
+        assert list(loaded._cache) == ['naproxen']
+        
+        loaded.load_cache(Path(temp_dir) / 'missing.json')
+        assert list(loaded._cache) == ['naproxen']
+    print("✓ Cache saved, loaded and bounded")
+
+
 def test_config_manager():
     """Test the configuration manager."""
     print("\n" + "="*60)
@@ -104,6 +240,25 @@ def test_config_manager():
         print(f"✗ Error: {e}")
 
 
+def test_config_ocr_use_gpu():
+    """Test parsing of the ocr.use_gpu setting."""
+    print("\n" + "="*60)
+    print("Testing OCR GPU Setting")
+    print("="*60)
+    
+    expected = [
+        ('"auto"', None), ('"Auto"', None), ('"true"', True), ('" TRUE "', True),
+        ('"false"', False), ('true', True), ('false', False), (None, None)
+    ]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_path = Path(temp_dir) / 'config.json'
+        for value, use_gpu in expected:
+            ocr_settings = '{}' if value is None else f'{{"use_gpu": {value}}}'
+            config_path.write_text(f'{{"openai": {{}}, "ocr": {ocr_settings}}}', encoding='utf-8')
+            assert ConfigManager(str(config_path)).ocr_use_gpu is use_gpu, value
+    print("✓ use_gpu parsed as auto, true or false")
+
+
 def main():
     """Run all tests."""
     print("\n" + "="*70)
@@ -111,7 +266,13 @@ def main():
     print("="*70)
     
     test_config_manager()
+    test_config_ocr_use_gpu()
     test_medicine_database()
+    test_medicine_database_batch_search()
+    test_medicine_database_might_contain()
+    test_medicine_database_records()
+    test_llm_response_parsing()
+    test_llm_analysis_cache()
     test_ocr_reader()
     
     print("\n" + "="*70)